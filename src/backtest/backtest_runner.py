@@ -0,0 +1,237 @@
+import argparse
+import asyncio
+import importlib
+import json
+import math
+from datetime import datetime, timezone
+from typing import List
+from src.backtest.strategy import Strategy
+from src.broadcasters.order_broadcaster import OrderBroadcaster
+from src.services.auth.auth_service import AuthService
+from src.services.market_data.candle_service import INTERVALS
+from src.utils.clock import Clock, SimulatedClock
+
+
+class BacktestAuth(AuthService):
+    """
+    Accepts any non-empty token and uses it as the user id, so strategies
+    can place orders with no auth backend
+    """
+
+    def validate_token(self, token) -> dict:
+        if token:
+            return {"success": True, "user_id": token}
+        return {"success": False, "error_message": "A token is required", "error_code": "TOKEN_INVALID"}
+
+    def validate_user_order(self, user_id, order_amount, side):
+        return True
+
+
+class HeadlessConnection:
+    """
+    Stands in for a ServerConnection: messages the broadcaster sends are
+    handed to the strategy, and the orders it returns are queued.
+    Exceptions raised by the strategy, or caused by its orders, are recorded
+    rather than propagated so one bad strategy can't stop the run.
+    """
+
+    def __init__(self, strategy: Strategy, clock: Clock):
+        self.strategy = strategy
+        self.clock = clock
+        self.pending_orders = []
+        self.orders_sent = 0
+        self.orders_dropped = 0
+        self.messages_received = 0
+        self.errors = []
+        self.exceptions = []
+
+    async def send(self, raw: str):
+        msg = json.loads(raw)
+        self.messages_received += 1
+        if msg.get("type") == "error":
+            self.errors.append(msg)
+
+        try:
+            orders = self.strategy.on_message(msg)
+            if orders is None:
+                orders = []
+            elif not isinstance(orders, (list, tuple)):
+                raise TypeError(
+                    f"on_message must return a list of orders, got {type(orders).__name__}")
+        except Exception as e:
+            self.record_exception(e, msg.get("type"))
+            return
+
+        self.pending_orders.extend(orders)
+
+    def record_exception(self, e: Exception, message_type: str):
+        self.exceptions.append({
+            "exception": type(e).__name__,
+            "message": str(e),
+            "message_type": message_type,
+            "timestamp": self.clock.now().isoformat(),
+        })
+
+
+def validate_order(order, tickers) -> dict:
+    """
+    Checks a strategy order before it reaches the broadcaster, which assumes
+    well-formed client payloads. Raises TypeError or ValueError on bad input.
+    """
+    if not isinstance(order, dict):
+        raise TypeError(f"Order must be a dict, got {type(order).__name__}")
+
+    if order.get("ticker") not in tickers:
+        raise ValueError(f"Unknown ticker: {order.get('ticker')!r}")
+
+    if order.get("type") not in ("Buy", "Sell"):
+        raise ValueError(
+            f"Order type must be Buy or Sell, got {order.get('type')!r}")
+
+    price = order.get("price")
+    if isinstance(price, bool) or not isinstance(price, (int, float)):
+        raise TypeError(f"Price must be a number, got {price!r}")
+    if not math.isfinite(price):
+        raise ValueError(f"Price must be finite, got {price!r}")
+
+    quantity = order.get("quantity")
+    if isinstance(quantity, bool) or not isinstance(quantity, int) or quantity <= 0:
+        raise ValueError(
+            f"Quantity must be a positive integer, got {quantity!r}")
+
+    return dict(order)
+
+
+class BacktestRunner:
+    """
+    Runs the order generator and strategy bots in-process against a
+    simulated clock, with no websockets. Each strategy may place at most
+    max_orders_per_tick orders per tick; the rest are dropped, which keeps
+    bots that react to each other's orders from flooding the run.
+    """
+
+    def __init__(self, strategies: List[Strategy], duration: float, seed: int = None, interval: float = 1,
+                 price_lower_bound: float = 10, price_upper_bound: float = 20, tickers: List[str] = None,
+                 start: datetime = datetime(2024, 1, 1, 9, 30, tzinfo=timezone.utc), max_orders_per_tick: int = 10):
+        tickers = tickers or ["QNTX"]
+        self.duration = duration
+        self.seed = seed
+        self.max_orders_per_tick = max_orders_per_tick
+        self.clock = SimulatedClock(start)
+        self.broadcaster = OrderBroadcaster(
+            host=None, port=None, interval=interval, price_lower_bound=price_lower_bound,
+            price_upper_bound=price_upper_bound, ticker=tickers[0], auth_service=BacktestAuth(),
+            tickers=tickers, clock=self.clock, seed=seed)
+        self.connections = [HeadlessConnection(strategy, self.clock)
+                            for strategy in strategies]
+
+    async def connect(self):
+        for connection in self.connections:
+            self.broadcaster.clients.add(connection)
+            for ticker in self.broadcaster.candle_subscriptions:
+                for interval in INTERVALS:
+                    self.broadcaster.candle_subscriptions[ticker][interval].add(
+                        connection)
+
+    async def place_pending_orders(self):
+        # Orders a strategy returns in reaction to these orders are queued for the next tick
+        for connection in self.connections:
+            orders, connection.pending_orders = connection.pending_orders, []
+            connection.orders_dropped += max(0,
+                                             len(orders) - self.max_orders_per_tick)
+
+            for order in orders[:self.max_orders_per_tick]:
+                try:
+                    order = validate_order(order, self.broadcaster.locks)
+                    connection.orders_sent += 1
+                    await self.broadcaster.on_message(
+                        {"type": "order", "token": connection.strategy.name, "order": order}, connection)
+                except Exception as e:
+                    connection.record_exception(e, "order")
+
+    def resting_orders(self, user_id: str) -> dict:
+        """
+        Total bid and ask quantity a strategy has resting on each ticker's book
+        """
+        resting = {ticker: {"bid_quantity": 0, "ask_quantity": 0}
+                   for ticker in self.broadcaster.locks}
+        for order in self.broadcaster.orders:
+            if order.get("user_id") == user_id:
+                side = "bid_quantity" if order["type"] == "Buy" else "ask_quantity"
+                resting[order["ticker"]][side] += order["quantity"]
+
+        for book in resting.values():
+            book["net_quantity"] = book["bid_quantity"] - book["ask_quantity"]
+        return resting
+
+    async def run(self) -> dict:
+        await self.connect()
+
+        started = self.clock.now()
+        end_time = self.clock.time() + self.duration
+        while self.clock.time() + self.broadcaster.interval <= end_time:
+            await self.clock.sleep(self.broadcaster.interval)
+            await self.broadcaster.broadcast_tick()
+            await self.place_pending_orders()
+
+        return self.results(started)
+
+    def results(self, started: datetime) -> dict:
+        return {
+            "seed": self.seed,
+            "start": started.isoformat(),
+            "end": self.clock.now().isoformat(),
+            "orders": self.broadcaster.orders,
+            "candles": {ticker: self.broadcaster.candle_service.get_candles(ticker, "1m")
+                        for ticker in self.broadcaster.candle_subscriptions},
+            "strategies": {
+                connection.strategy.name: {
+                    "orders_sent": connection.orders_sent,
+                    "orders_dropped": connection.orders_dropped,
+                    "resting_orders": self.resting_orders(connection.strategy.name),
+                    "messages_received": connection.messages_received,
+                    "errors": connection.errors,
+                    "exceptions": connection.exceptions,
+                }
+                for connection in self.connections
+            },
+        }
+
+
+def load_strategy(path: str, name: str) -> Strategy:
+    """
+    Loads a strategy from "package.module:ClassName"
+    """
+    module_name, class_name = path.split(":")
+    strategy_class = getattr(importlib.import_module(module_name), class_name)
+    return strategy_class(name)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run strategies against the simulator with no websockets")
+    parser.add_argument("--strategy", action="append", default=[],
+                        help="Strategy class as package.module:ClassName, may be repeated")
+    parser.add_argument("--duration", type=float, default=3600,
+                        help="Simulated seconds to run")
+    parser.add_argument("--interval", type=float, default=1,
+                        help="Simulated seconds between generated orders")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-orders-per-tick", type=int, default=10,
+                        help="Orders each strategy may place per tick before the rest are dropped")
+    parser.add_argument("--output", default="backtest_results.json")
+    args = parser.parse_args()
+
+    strategies = [load_strategy(path, f"strategy_{i}")
+                  for i, path in enumerate(args.strategy or ["src.backtest.strategy:MeanReversionStrategy"])]
+    runner = BacktestRunner(strategies, duration=args.duration, seed=args.seed,
+                            interval=args.interval, max_orders_per_tick=args.max_orders_per_tick)
+    results = asyncio.run(runner.run())
+
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Wrote {len(results['orders'])} orders to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
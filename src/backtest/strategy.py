@@ -0,0 +1,57 @@
+from abc import ABC, abstractmethod
+from typing import List
+from src.broadcasters.order_broadcaster import GENERATOR_USER_ID
+
+
+class Strategy(ABC):
+    """
+    A trading bot driven by the same messages a websocket client receives
+    ("update", "candle", "order_success", "error", ...). Orders returned from
+    on_message are placed before the next simulated tick.
+    """
+
+    def __init__(self, name: str, ticker: str = "QNTX"):
+        self.name = name
+        self.ticker = ticker
+
+    @abstractmethod
+    def on_message(self, msg: dict) -> List[dict]:
+        """
+        Reacts to a server message, returns a list of orders to place.
+        Each order has the same shape as a client order payload:
+        {"type": "Buy" or "Sell", "price": <number>, "quantity": <int>, "ticker": "<TICKER>"}
+        """
+        pass
+
+
+class MeanReversionStrategy(Strategy):
+    """
+    Example bot: buys when a generated print is below its moving average
+    and sells when it is above. Orders from other bots are ignored so that
+    several bots don't keep trading off each other.
+    """
+
+    def __init__(self, name: str, ticker: str = "QNTX", window: int = 20, quantity: int = 5):
+        super().__init__(name, ticker)
+        self.window = window
+        self.quantity = quantity
+        self.prices = []
+
+    def on_message(self, msg: dict) -> List[dict]:
+        if msg.get("type") != "update":
+            return []
+
+        order = msg["order"]
+        if order.get("ticker") != self.ticker or order.get("user_id") != GENERATOR_USER_ID:
+            return []
+
+        self.prices = (self.prices + [order["price"]])[-self.window:]
+        if len(self.prices) < self.window:
+            return []
+
+        average = sum(self.prices) / len(self.prices)
+        if order["price"] == average:
+            return []
+
+        side = "Buy" if order["price"] < average else "Sell"
+        return [{"type": side, "price": order["price"], "quantity": self.quantity, "ticker": self.ticker}]
@@ -2,18 +2,19 @@ import websockets
 import asyncio
 from abc import ABC, abstractmethod
 import json
-from datetime import datetime
 from websockets.asyncio.server import ServerConnection
+from src.utils.clock import Clock, SystemClock
 
 
 class BaseBroadcaster(ABC):
 
-    def __init__(self, host, port, interval: float, timeout=None):
+    def __init__(self, host, port, interval: float, timeout=None, clock: Clock = None):
         self.interval = interval
         self.host = host
         self.port = port
         self.clients = set()
         self.timeout = timeout
+        self.clock = clock or SystemClock()
 
         self.clients_lock = asyncio.Lock()
 
@@ -43,18 +44,23 @@ class BaseBroadcaster(ABC):
             print("Client disconnected")
             async with self.clients_lock:
                 self.clients.discard(websocket)
+            await self.on_disconnect(websocket)
 
     async def broadcast_periodic(self):
         while True:
-            await asyncio.sleep(self.interval)
-            try:
-                message = await self.create_message()
-                print(message)
-            except Exception as e:
-                print(e)
-                message = {"error": e}
+            await self.clock.sleep(self.interval)
+            message = await self.broadcast_tick()
+            print(message)
 
-            await self.broadcast_message(message)
+    async def broadcast_tick(self) -> dict:
+        try:
+            message = await self.create_message()
+        except Exception as e:
+            print(e)
+            message = {"error": str(e)}
+
+        await self.broadcast_message(message)
+        return message
 
     async def broadcast_message(self, message: dict):
         async with self.clients_lock:
@@ -71,10 +77,13 @@ class BaseBroadcaster(ABC):
             "type": "error",
             "error_type": error_type,
             "error_message": error_message,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": self.clock.now().isoformat()
         }
         await websocket.send(json.dumps(error_response))
 
+    async def on_disconnect(self, client: ServerConnection):
+        pass
+
     @ abstractmethod
     async def initial_connection_action(self):
         pass
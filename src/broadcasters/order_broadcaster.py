@@ -1,28 +1,38 @@
 from src.broadcasters.base_broadcaster import BaseBroadcaster
-import numpy as np
-from datetime import datetime
-from uuid import uuid4
 from src.services.auth.auth_service import AuthService
+from src.services.market_data.candle_service import CandleService, INTERVALS
 import json
 import asyncio
 from typing import List
 from websockets.asyncio.server import ServerConnection
+from src.utils.clock import Clock
+
+# User id attached to orders from the random order generator
+GENERATOR_USER_ID = "tradingbot@colorado.edu"
 
 
 class OrderBroadcaster(BaseBroadcaster):
-    def __init__(self, host, port, interval: float, price_lower_bound: float, price_upper_bound: float, ticker: str, auth_service: AuthService, tickers: List[str]):
-        super().__init__(host, port, interval)
+    def __init__(self, host, port, interval: float, price_lower_bound: float, price_upper_bound: float, ticker: str, auth_service: AuthService, tickers: List[str], clock: Clock = None, seed: int = None):
+        super().__init__(host, port, interval, clock=clock)
         self.price_lower_bound = price_lower_bound
         self.price_upper_bound = price_upper_bound
         self.ticker = ticker
         self.auth_service = auth_service
 
+        # Random generator for simulated orders, created on first use
+        self.seed = seed
+        self.rng = None
+
         self.orders = []
 
         self.order_map = self.create_ticker_map(tickers)
         self.locks = {ticker: asyncio.Lock() for ticker in tickers}
         self.client_subscriptions = self.create_subscription_map(tickers)
 
+        self.candle_service = CandleService(tickers)
+        self.candle_subscriptions = self.create_candle_subscription_map(
+            tickers)
+
         self.orders_lock = asyncio.Lock()
 
     def create_ticker_map(self, tickers: List[str]):
@@ -34,28 +44,35 @@ class OrderBroadcaster(BaseBroadcaster):
     def create_subscription_map(self, tickers: List[str]):
         return {ticker: set() for ticker in tickers}
 
+    def create_candle_subscription_map(self, tickers: List[str]):
+        return {ticker: {interval: set() for interval in INTERVALS} for ticker in tickers}
+
     async def create_message(self):
         order = await self.create_random_order()
         return order
 
     async def create_random_order(self):
-        order_type = np.random.choice(["Buy", "Sell"])
+        if self.rng is None:
+            import numpy as np
+            self.rng = np.random.default_rng(self.seed)
+
+        order_type = str(self.rng.choice(["Buy", "Sell"]))
 
-        price = np.round(np.random.uniform(
-            self.price_lower_bound, self.price_upper_bound), 2)
+        price = round(float(self.rng.uniform(
+            self.price_lower_bound, self.price_upper_bound)), 2)
 
-        quantity = np.random.randint(1, 50)
+        quantity = int(self.rng.integers(1, 50))
 
         ticker = "QNTX"
 
         order = {
-            'id': uuid4().hex,
+            'id': self.rng.bytes(16).hex(),
             'type': order_type,
             'price': price,
             'quantity': quantity,
             'ticker': ticker,
-            'user_id': 'tradingbot@colorado.edu',
-            'timestamp': datetime.now().isoformat()
+            'user_id': GENERATOR_USER_ID,
+            'timestamp': self.clock.now().isoformat()
         }
 
         async with self.orders_lock:
@@ -64,6 +81,8 @@ class OrderBroadcaster(BaseBroadcaster):
         async with self.locks[ticker]:
             self.order_map
 
+        await self.record_trade(order)
+
         return {'order': order, 'type': 'update'}
 
     async def initial_connection_action(self, client: ServerConnection):
@@ -100,6 +119,14 @@ class OrderBroadcaster(BaseBroadcaster):
 
         elif message_type == "order":
             await self.handle_order(websocket, msg)
+        elif message_type == "subscribe_candles":
+            await self.handle_candle_subscription(websocket, msg, subscribe=True)
+        elif message_type == "unsubscribe_candles":
+            await self.handle_candle_subscription(websocket, msg, subscribe=False)
+        elif message_type == "candles":
+            await self.handle_candle_query(websocket, msg)
+        elif message_type == "trades":
+            await self.handle_trade_query(websocket, msg)
         else:
             await self.send_error(websocket, "INVALID_MESSAGE_TYPE", "Message type is invalid")
 
@@ -109,7 +136,7 @@ class OrderBroadcaster(BaseBroadcaster):
 
         if response.get("success", False) == False:
             error_type, error_message = response.get(
-                "error_code", None), response.get("error_message", None)
+                "error_code", None), response.get("error_message", response.get("error", None))
             print(f"ERROR: {error_type}, {error_message}")
             await self.send_error(websocket, error_type, error_message)
             return
@@ -137,8 +164,99 @@ class OrderBroadcaster(BaseBroadcaster):
         async with self.locks[ticker]:
             self.order_map[ticker][side][price] = self.order_map[ticker][side].get(
                 price, 0) + order['quantity']
+        await self.record_trade(order)
         await asyncio.gather(
             websocket.send(json.dumps(
                 {"type": "order_success", "message": "Order placed successfully"})),
             self.broadcast_message({"type": "update", "order": order})
         )
+
+    async def on_disconnect(self, client: ServerConnection):
+        async with self.clients_lock:
+            for subscribers in self.client_subscriptions.values():
+                subscribers.discard(client)
+            for intervals in self.candle_subscriptions.values():
+                for subscribers in intervals.values():
+                    subscribers.discard(client)
+
+    async def record_trade(self, order: dict):
+        """
+        Folds an order into the ticker's candles and trade tape, then pushes
+        the updated bars to candle subscribers
+        """
+        ticker = order.get("ticker")
+        if ticker not in self.candle_subscriptions:
+            return
+
+        async with self.locks[ticker]:
+            updated = self.candle_service.record(ticker, self.clock.time(), float(order["price"]),
+                                                 float(order["quantity"]), order["type"])
+
+        async with self.clients_lock:
+            deliveries = [(client, interval, bar)
+                          for interval, bar in updated.items()
+                          for client in self.candle_subscriptions[ticker][interval]]
+
+        await asyncio.gather(*[client.send(json.dumps({"type": "candle", "ticker": ticker, "interval": interval, "candle": bar}))
+                               for client, interval, bar in deliveries],
+                             return_exceptions=True)
+
+    async def validate_market_data_request(self, websocket: ServerConnection, msg: dict, require_interval: bool):
+        ticker = str(msg.get("ticker", "")).upper()
+        if ticker not in self.candle_subscriptions:
+            await self.send_error(websocket, "INVALID_TICKER", f"Ticker: {ticker} is invalid")
+            return None, None
+
+        interval = msg.get("interval", None)
+        if require_interval and interval not in INTERVALS:
+            await self.send_error(websocket, "INVALID_INTERVAL", f"Interval must be one of {list(INTERVALS)}")
+            return None, None
+
+        start, end = msg.get("start", None), msg.get("end", None)
+        if any(bound is not None and (isinstance(bound, bool) or not isinstance(bound, (int, float))) for bound in (start, end)):
+            await self.send_error(websocket, "VALUE_ERROR", "Range bounds must be epoch seconds")
+            return None, None
+
+        limit = msg.get("limit", None)
+        if limit is not None and (isinstance(limit, bool) or not isinstance(limit, int) or limit < 0):
+            await self.send_error(websocket, "VALUE_ERROR", "Limit must be a non-negative integer")
+            return None, None
+
+        return ticker, interval
+
+    async def handle_candle_subscription(self, websocket: ServerConnection, msg: dict, subscribe: bool):
+        ticker, interval = await self.validate_market_data_request(websocket, msg, require_interval=True)
+        if not ticker:
+            return
+
+        async with self.clients_lock:
+            if subscribe:
+                self.candle_subscriptions[ticker][interval].add(websocket)
+            else:
+                self.candle_subscriptions[ticker][interval].discard(websocket)
+
+        if subscribe:
+            await self.send_candles(websocket, msg, ticker, interval)
+
+    async def handle_candle_query(self, websocket: ServerConnection, msg: dict):
+        ticker, interval = await self.validate_market_data_request(websocket, msg, require_interval=True)
+        if not ticker:
+            return
+
+        await self.send_candles(websocket, msg, ticker, interval)
+
+    async def send_candles(self, websocket: ServerConnection, msg: dict, ticker: str, interval: str):
+        async with self.locks[ticker]:
+            candles = self.candle_service.get_candles(
+                ticker, interval, msg.get("start", None), msg.get("end", None))
+        await websocket.send(json.dumps({"type": "candles", "ticker": ticker, "interval": interval, "candles": candles}))
+
+    async def handle_trade_query(self, websocket: ServerConnection, msg: dict):
+        ticker, _ = await self.validate_market_data_request(websocket, msg, require_interval=False)
+        if not ticker:
+            return
+
+        async with self.locks[ticker]:
+            trades = self.candle_service.get_trades(
+                ticker, msg.get("limit", None))
+        await websocket.send(json.dumps({"type": "trades", "ticker": ticker, "trades": trades}))
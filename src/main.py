@@ -1,11 +1,42 @@
+import os
+import sys
 from src.broadcasters.order_broadcaster import OrderBroadcaster
-from src.services.auth.firebase_auth_service import FirebaseAuth
 
 TICKERS = ["QNTX"]
+AUTH_BACKENDS = ["firebase", "jwks"]
+
+
+def create_auth_service():
+    """
+    Picks the auth backend from AUTH_BACKEND: "firebase" (default) or "jwks"
+    for offline verification against a cached key file
+    """
+    raw_backend = os.environ.get("AUTH_BACKEND", "firebase")
+    backend = raw_backend.strip().lower()
+    if backend not in AUTH_BACKENDS:
+        raise ValueError(
+            f"Unknown AUTH_BACKEND: {raw_backend!r}, expected one of {AUTH_BACKENDS}")
+
+    if backend == "jwks":
+        project_id = os.environ.get("FIREBASE_PROJECT_ID")
+        if not project_id:
+            raise ValueError(
+                "FIREBASE_PROJECT_ID must be set when AUTH_BACKEND is jwks")
+
+        from src.services.auth.jwks_auth_service import JWKSAuth
+        return JWKSAuth(jwks_path=os.environ.get("JWKS_PATH", "jwks.json"),
+                        project_id=project_id)
+
+    from src.services.auth.firebase_auth_service import FirebaseAuth
+    return FirebaseAuth(credential_path=os.environ.get("FIREBASE_CREDENTIALS", "service-account.json"))
 
 
 if __name__ == "__main__":
-    auth_service = FirebaseAuth()
+    try:
+        auth_service = create_auth_service()
+    except ValueError as e:
+        sys.exit(f"Invalid auth configuration: {e}")
+
     order_broadcaster = OrderBroadcaster(
         host="localhost", port=8765, interval=30, price_lower_bound=10, price_upper_bound=20, ticker="QNTX", auth_service=auth_service, tickers=TICKERS)
 
@@ -1,6 +1,15 @@
-import firebase_admin
-from firebase_admin import credentials
+DEFAULT_CREDENTIAL_PATH = "service-account.json"
 
-cred = credentials.Certificate("/service-account.json")
 
-firebase_admin.initialize_app(cred)
+def initialize_firebase(credential_path: str = DEFAULT_CREDENTIAL_PATH):
+    """
+    Initializes the default Firebase app on first use and returns it.
+    Safe to call repeatedly; the SDK is only imported when this runs.
+    """
+    import firebase_admin
+    from firebase_admin import credentials
+
+    if not firebase_admin._apps:
+        cred = credentials.Certificate(credential_path)
+        firebase_admin.initialize_app(cred)
+    return firebase_admin.get_app()
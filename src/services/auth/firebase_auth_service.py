@@ -1,18 +1,26 @@
 from src.services.auth.auth_service import AuthService
-from firebase_admin import auth, credentials
-import firebase_admin
-
-if not firebase_admin._apps:
-    cred = credentials.Certificate("service-account.json")
-    firebase_admin.initialize_app(cred)
+from src.services.auth.auth_instance import DEFAULT_CREDENTIAL_PATH, initialize_firebase
 
 
 class FirebaseAuth(AuthService):
 
-    def __init__(self):
+    def __init__(self, credential_path: str = DEFAULT_CREDENTIAL_PATH):
         super().__init__()
+        self.credential_path = credential_path
 
     def validate_token(self, token) -> dict:
+        # Deferred so importing this module doesn't pull in the SDK or read credentials
+        try:
+            initialize_firebase(self.credential_path)
+            from firebase_admin import auth
+        except Exception as e:
+            print(f"Failed to initialize Firebase: {e}")
+            return {
+                "success": False,
+                "error_message": "Authentication is unavailable. Please try again later.",
+                "error_code": "AUTH_UNAVAILABLE"
+            }
+
         try:
 
             decoded_token = auth.verify_id_token(token)
@@ -0,0 +1,87 @@
+from src.services.auth.auth_service import AuthService
+import json
+
+FIREBASE_ISSUER = "https://securetoken.google.com/{project_id}"
+
+
+class JWKSAuth(AuthService):
+    """
+    Verifies Firebase ID tokens locally against a cached JWKS file, so the
+    server can authenticate users without credentials or network access.
+    Requires PyJWT with the crypto extra (pip install "PyJWT[crypto]").
+    """
+
+    def __init__(self, jwks_path: str, project_id: str, leeway: float = 0):
+        super().__init__()
+        self.jwks_path = jwks_path
+        self.project_id = project_id
+        self.leeway = leeway
+        self.keys = None
+
+    def load_keys(self):
+        if self.keys is None:
+            import jwt
+
+            with open(self.jwks_path) as f:
+                key_set = jwt.PyJWKSet.from_dict(json.load(f))
+            self.keys = {key.key_id: key for key in key_set.keys}
+        return self.keys
+
+    def validate_token(self, token) -> dict:
+        try:
+            import jwt
+            keys = self.load_keys()
+        except Exception as e:
+            print(f"Failed to load JWKS from {self.jwks_path}: {e}")
+            return {
+                "success": False,
+                "error_message": "Authentication is unavailable. Please try again later.",
+                "error_code": "AUTH_UNAVAILABLE"
+            }
+
+        try:
+            key_id = jwt.get_unverified_header(token).get("kid")
+            if key_id not in keys:
+                raise jwt.InvalidTokenError(f"Unknown signing key: {key_id}")
+
+            decoded_token = jwt.decode(
+                token,
+                keys[key_id].key,
+                algorithms=["RS256"],
+                audience=self.project_id,
+                issuer=FIREBASE_ISSUER.format(project_id=self.project_id),
+                leeway=self.leeway,
+                options={"require": ["exp", "iat", "sub"]},
+            )
+            user_id = decoded_token.get("user_id", decoded_token["sub"])
+
+            return {"success": True, "user_id": user_id}
+
+        except jwt.ExpiredSignatureError:
+            return {
+                "success": False,
+                "error_message": "Token has expired. Please log in again.",
+                "error_code": "TOKEN_EXPIRED"
+            }
+
+        except jwt.InvalidTokenError:
+            return {
+                "success": False,
+                "error_message": "Invalid token. Please log in again.",
+                "error_code": "TOKEN_INVALID"
+            }
+
+        except Exception as e:
+            print(f"Unexpected error verifying token: {e}")
+            return {
+                "success": False,
+                "error_message": "Authentication failed. Please try again.",
+                "error_code": "AUTH_ERROR"
+            }
+
+    def validate_user_order(self, user_id, order_amount, side):
+        """
+        To implement:
+        Checks to see if user is able to make a specific order
+        """
+        return True
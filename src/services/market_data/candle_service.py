@@ -0,0 +1,180 @@
+from typing import Dict, List, Optional
+
+# Supported bar intervals, in seconds
+INTERVALS = {"1s": 1, "1m": 60, "5m": 300}
+
+SIDES = {"Buy": 1, "Sell": -1}
+SIDE_NAMES = {1: "Buy", -1: "Sell"}
+
+
+class CandleSeries:
+    """
+    Fixed-size ring buffer of OHLCV bars for a single interval.
+    Bars are updated in place as prints arrive; once the buffer is full
+    the oldest bar is overwritten. Arrays are allocated on the first print.
+    """
+
+    def __init__(self, interval: int, capacity: int):
+        self.interval = interval
+        self.capacity = capacity
+
+        self.head = 0
+        self.count = 0
+
+    def allocate(self):
+        import numpy as np
+
+        self.start = np.zeros(self.capacity, dtype=np.int64)
+        self.open = np.zeros(self.capacity, dtype=np.float64)
+        self.high = np.zeros(self.capacity, dtype=np.float64)
+        self.low = np.zeros(self.capacity, dtype=np.float64)
+        self.close = np.zeros(self.capacity, dtype=np.float64)
+        self.volume = np.zeros(self.capacity, dtype=np.float64)
+
+    def update(self, timestamp: float, price: float, quantity: float) -> Optional[dict]:
+        """
+        Folds a print into the current bar, opening a new bar when the
+        timestamp crosses an interval boundary. Prints older than the
+        current bar are dropped. Returns the touched bar.
+        """
+        if not self.count:
+            self.allocate()
+
+        bucket = int(timestamp // self.interval) * self.interval
+        last = (self.head - 1) % self.capacity
+
+        if self.count and bucket < self.start[last]:
+            return None
+
+        if self.count and bucket == self.start[last]:
+            self.high[last] = max(self.high[last], price)
+            self.low[last] = min(self.low[last], price)
+            self.close[last] = price
+            self.volume[last] += quantity
+            return self.bar(last)
+
+        index = self.head
+        self.start[index] = bucket
+        self.open[index] = price
+        self.high[index] = price
+        self.low[index] = price
+        self.close[index] = price
+        self.volume[index] = quantity
+
+        self.head = (self.head + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+        return self.bar(index)
+
+    def bar(self, index: int) -> dict:
+        return {
+            "time": int(self.start[index]),
+            "open": float(self.open[index]),
+            "high": float(self.high[index]),
+            "low": float(self.low[index]),
+            "close": float(self.close[index]),
+            "volume": float(self.volume[index]),
+        }
+
+    def ordered_indices(self):
+        import numpy as np
+
+        return (self.head - self.count + np.arange(self.count)) % self.capacity
+
+    def query(self, start: Optional[float] = None, end: Optional[float] = None) -> List[dict]:
+        """
+        Returns bars whose start time falls within [start, end], oldest first
+        """
+        if not self.count:
+            return []
+
+        indices = self.ordered_indices()
+        times = self.start[indices]
+        if start is not None:
+            indices = indices[times >= start]
+            times = self.start[indices]
+        if end is not None:
+            indices = indices[times <= end]
+        return [self.bar(i) for i in indices]
+
+
+class TradeTape:
+    """
+    Fixed-size ring buffer of the most recent prints for a single ticker.
+    Arrays are allocated on the first print.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+
+        self.head = 0
+        self.count = 0
+
+    def allocate(self):
+        import numpy as np
+
+        self.timestamp = np.zeros(self.capacity, dtype=np.float64)
+        self.price = np.zeros(self.capacity, dtype=np.float64)
+        self.quantity = np.zeros(self.capacity, dtype=np.float64)
+        self.side = np.zeros(self.capacity, dtype=np.int8)
+
+    def append(self, timestamp: float, price: float, quantity: float, side: str):
+        if not self.count:
+            self.allocate()
+
+        index = self.head
+        self.timestamp[index] = timestamp
+        self.price[index] = price
+        self.quantity[index] = quantity
+        self.side[index] = SIDES.get(side, 0)
+
+        self.head = (self.head + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def entry(self, index: int) -> dict:
+        return {
+            "time": float(self.timestamp[index]),
+            "price": float(self.price[index]),
+            "quantity": float(self.quantity[index]),
+            "side": SIDE_NAMES.get(int(self.side[index])),
+        }
+
+    def latest(self, limit: Optional[int] = None) -> List[dict]:
+        """
+        Returns up to `limit` of the most recent prints, oldest first
+        """
+        count = self.count if limit is None else max(0, min(limit, self.count))
+        return [self.entry((self.head - count + i) % self.capacity) for i in range(count)]
+
+
+class CandleService:
+    """
+    Maintains rolling OHLCV bars at every supported interval, plus a
+    bounded trade tape, for each ticker.
+    """
+
+    def __init__(self, tickers: List[str], candle_capacity: int = 1000, tape_capacity: int = 500):
+        self.candles = {
+            ticker: {name: CandleSeries(seconds, candle_capacity)
+                     for name, seconds in INTERVALS.items()}
+            for ticker in tickers
+        }
+        self.tapes = {ticker: TradeTape(tape_capacity) for ticker in tickers}
+
+    def record(self, ticker: str, timestamp: float, price: float, quantity: float, side: str) -> Dict[str, dict]:
+        """
+        Records a print and returns the updated bar for each interval
+        """
+        self.tapes[ticker].append(timestamp, price, quantity, side)
+
+        updated = {}
+        for name, series in self.candles[ticker].items():
+            bar = series.update(timestamp, price, quantity)
+            if bar is not None:
+                updated[name] = bar
+        return updated
+
+    def get_candles(self, ticker: str, interval: str, start: Optional[float] = None, end: Optional[float] = None) -> List[dict]:
+        return self.candles[ticker][interval].query(start, end)
+
+    def get_trades(self, ticker: str, limit: Optional[int] = None) -> List[dict]:
+        return self.tapes[ticker].latest(limit)
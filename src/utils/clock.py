@@ -0,0 +1,55 @@
+import asyncio
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+
+
+class Clock(ABC):
+
+    @abstractmethod
+    def now(self) -> datetime:
+        pass
+
+    def time(self) -> float:
+        """
+        Current time as epoch seconds
+        """
+        return self.now().timestamp()
+
+    @abstractmethod
+    async def sleep(self, seconds: float):
+        pass
+
+
+class SystemClock(Clock):
+    """
+    Wall-clock time, used by the live server
+    """
+
+    def now(self) -> datetime:
+        return datetime.now()
+
+    async def sleep(self, seconds: float):
+        await asyncio.sleep(seconds)
+
+
+class SimulatedClock(Clock):
+    """
+    Clock that only moves when advanced. Sleeping advances simulated time
+    immediately instead of waiting, so a session runs as fast as the CPU allows.
+    The start time must be timezone-aware so epoch times don't depend on the host.
+    """
+
+    def __init__(self, start: datetime = datetime(2024, 1, 1, 9, 30, tzinfo=timezone.utc)):
+        if start.tzinfo is None:
+            raise ValueError("SimulatedClock requires a timezone-aware start time")
+        self.current = start
+
+    def now(self) -> datetime:
+        return self.current
+
+    def advance(self, seconds: float):
+        self.current += timedelta(seconds=seconds)
+
+    async def sleep(self, seconds: float):
+        self.advance(seconds)
+        await asyncio.sleep(0)
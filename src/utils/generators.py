@@ -1,19 +1,23 @@
-import numpy as np
-from datetime import datetime
+from src.utils.clock import Clock, SystemClock
 
 
-def create_random_order(price_lower_bound, price_upper_bound, ticker):
-    order_type = np.random.choice(["Buy", "Sell"])
+def create_random_order(price_lower_bound, price_upper_bound, ticker, clock: Clock = None, rng=None):
+    import numpy as np
 
-    price = np.round(np.random.uniform(
-        price_lower_bound, price_upper_bound), 2)
+    clock = clock or SystemClock()
+    rng = rng or np.random.default_rng()
 
-    quantity = np.random.randint(1, 50)
+    order_type = str(rng.choice(["Buy", "Sell"]))
+
+    price = round(float(rng.uniform(
+        price_lower_bound, price_upper_bound)), 2)
+
+    quantity = int(rng.integers(1, 50))
 
     return {
         'type': order_type,
         'price': price,
         'quantity': quantity,
         'ticker': ticker,
-        'timestamp': datetime.now().isoformat()
+        'timestamp': clock.now().isoformat()
     }
@@ -0,0 +1,137 @@
+import unittest
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from unittest import mock
+from src.main import create_auth_service
+from tests import test_order
+from src.services.auth.jwks_auth_service import JWKSAuth
+
+try:
+    import jwt
+    from cryptography.hazmat.primitives.asymmetric import rsa
+except ImportError:
+    jwt = None
+
+PROJECT_ID = "quantx-test"
+
+
+class TestLazyImports(unittest.TestCase):
+
+    def test_broadcaster_import_skips_heavy_dependencies(self):
+        code = ("import sys\n"
+                "import src.main\n"
+                "import src.services.auth.firebase_auth_service\n"
+                "print(sorted(m for m in ('numpy', 'firebase_admin', 'jwt') if m in sys.modules))")
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                                check=True, cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        self.assertEqual(output.stdout.strip(), "[]")
+
+
+class TestCreateAuthService(unittest.TestCase):
+
+    def test_backend_name_is_case_insensitive(self):
+        env = {"AUTH_BACKEND": "JWKS", "FIREBASE_PROJECT_ID": PROJECT_ID}
+        with mock.patch.dict(os.environ, env):
+            self.assertIsInstance(create_auth_service(), JWKSAuth)
+
+    def test_unknown_backend_rejected(self):
+        with mock.patch.dict(os.environ, {"AUTH_BACKEND": "jwsk"}):
+            with self.assertRaisesRegex(ValueError, "Unknown AUTH_BACKEND"):
+                create_auth_service()
+
+    def test_jwks_requires_project_id(self):
+        with mock.patch.dict(os.environ, {"AUTH_BACKEND": "jwks"}):
+            os.environ.pop("FIREBASE_PROJECT_ID", None)
+            with self.assertRaisesRegex(ValueError, "FIREBASE_PROJECT_ID"):
+                create_auth_service()
+
+
+@unittest.skipIf(jwt is None, "PyJWT[crypto] is not installed")
+class TestJWKSAuth(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.private_key = rsa.generate_private_key(
+            public_exponent=65537, key_size=2048)
+        jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(
+            cls.private_key.public_key()))
+        jwk.update({"kid": "test-key", "alg": "RS256", "use": "sig"})
+
+        cls.jwks_file = tempfile.NamedTemporaryFile(
+            "w", suffix=".json", delete=False)
+        json.dump({"keys": [jwk]}, cls.jwks_file)
+        cls.jwks_file.close()
+
+    @classmethod
+    def tearDownClass(cls):
+        os.unlink(cls.jwks_file.name)
+
+    def make_token(self, **overrides):
+        now = int(time.time())
+        claims = {
+            "iss": f"https://securetoken.google.com/{PROJECT_ID}",
+            "aud": PROJECT_ID,
+            "sub": "uid-123",
+            "user_id": "uid-123",
+            "iat": now,
+            "exp": now + 3600,
+        }
+        claims.update(overrides)
+        return jwt.encode(claims, self.private_key, algorithm="RS256", headers={"kid": "test-key"})
+
+    def setUp(self):
+        self.auth_service = JWKSAuth(self.jwks_file.name, PROJECT_ID)
+
+    def test_valid_token(self):
+        response = self.auth_service.validate_token(self.make_token())
+        self.assertEqual(response, {"success": True, "user_id": "uid-123"})
+
+    def test_expired_token(self):
+        response = self.auth_service.validate_token(
+            self.make_token(exp=int(time.time()) - 10))
+        self.assertEqual(response["error_code"], "TOKEN_EXPIRED")
+
+    def test_wrong_audience(self):
+        response = self.auth_service.validate_token(
+            self.make_token(aud="other-project"))
+        self.assertEqual(response["error_code"], "TOKEN_INVALID")
+
+    def test_missing_token(self):
+        response = self.auth_service.validate_token(None)
+        self.assertEqual(response["error_code"], "TOKEN_INVALID")
+
+    def test_missing_jwks_file(self):
+        auth_service = JWKSAuth("does-not-exist.json", PROJECT_ID)
+        response = auth_service.validate_token(self.make_token())
+        self.assertEqual(response["error_code"], "AUTH_UNAVAILABLE")
+
+
+class TestAuthErrorDelivery(unittest.IsolatedAsyncioTestCase):
+
+    async def send_order(self, auth_service, token):
+        broadcaster = test_order.TestBroadcaster(host="localhost", port=8765, interval=30, price_lower_bound=10,
+                                                 price_upper_bound=20, ticker="QNTX", auth_service=auth_service, tickers=["QNTX"])
+        socket = test_order.TestSocket()
+        await broadcaster.handle_order(socket, {"token": token, "order": {}})
+        return json.loads(socket.get_messages()[0])
+
+    async def test_unavailable_backend_message_reaches_client(self):
+        response = await self.send_order(JWKSAuth("does-not-exist.json", PROJECT_ID), "token")
+
+        self.assertEqual(response["error_type"], "AUTH_UNAVAILABLE")
+        self.assertEqual(response["error_message"],
+                         "Authentication is unavailable. Please try again later.")
+
+    async def test_legacy_error_key_reaches_client(self):
+        class LegacyAuth(test_order.TestAuthService):
+            def validate_token(self, token):
+                return {"success": False, "error": "Token has expired. Please log in again.", "error_code": "TOKEN_EXPIRED"}
+
+        response = await self.send_order(LegacyAuth(), "token")
+
+        self.assertEqual(response["error_message"],
+                         "Token has expired. Please log in again.")
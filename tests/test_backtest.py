@@ -0,0 +1,143 @@
+import unittest
+import json
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import List
+from src.backtest.backtest_runner import BacktestRunner
+from src.backtest.strategy import MeanReversionStrategy, Strategy
+from src.utils.clock import SimulatedClock
+
+
+class RecordingStrategy(Strategy):
+
+    def __init__(self, name: str, ticker: str = "QNTX"):
+        super().__init__(name, ticker)
+        self.received = []
+
+    def on_message(self, msg: dict) -> List[dict]:
+        self.received.append(msg["type"])
+        if msg["type"] == "update" and msg["order"]["user_id"] != self.name:
+            return [{"type": "Buy", "price": 15.0, "quantity": 1, "ticker": self.ticker}]
+        return []
+
+
+class FailingStrategy(Strategy):
+
+    def on_message(self, msg: dict) -> List[dict]:
+        if msg["type"] == "update":
+            raise ValueError("bad signal")
+        return None
+
+
+class MalformedOrderStrategy(Strategy):
+
+    def on_message(self, msg: dict) -> List[dict]:
+        if msg["type"] != "update" or msg["order"]["user_id"] == self.name:
+            return []
+        return [
+            {"type": "Buy", "price": 15.0, "quantity": 1, "ticker": "XYZ"},
+            {"type": "Buy", "quantity": 1, "ticker": self.ticker},
+            {"type": "Buy", "price": 15.0, "ticker": self.ticker},
+            {"type": "Buy", "price": "15", "quantity": 1, "ticker": self.ticker},
+            "not an order",
+            {"type": "Sell", "price": 15.0, "quantity": 2, "ticker": self.ticker},
+        ]
+
+
+class TestSimulatedClock(unittest.IsolatedAsyncioTestCase):
+
+    async def test_sleep_advances_time(self):
+        clock = SimulatedClock(datetime(2024, 1, 1, tzinfo=timezone.utc))
+        start = clock.time()
+        await clock.sleep(90)
+
+        self.assertEqual(clock.time() - start, 90)
+        self.assertEqual(clock.now(), datetime(
+            2024, 1, 1, 0, 1, 30, tzinfo=timezone.utc))
+
+    def test_naive_start_rejected(self):
+        with self.assertRaises(ValueError):
+            SimulatedClock(datetime(2024, 1, 1))
+
+    def test_candle_times_independent_of_timezone(self):
+        code = ("import asyncio\n"
+                "from src.backtest.backtest_runner import BacktestRunner\n"
+                "results = asyncio.run(BacktestRunner([], duration=120, seed=42).run())\n"
+                "print(results['candles']['QNTX'][0]['time'])")
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        times = [subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                                cwd=root, env={**os.environ, "TZ": tz}).stdout.strip()
+                 for tz in ["UTC", "America/New_York"]]
+
+        self.assertEqual(times, ["1704101400", "1704101400"])
+
+
+class TestBacktestRunner(unittest.IsolatedAsyncioTestCase):
+
+    async def test_runs_for_simulated_duration(self):
+        runner = BacktestRunner([], duration=3600, seed=1, interval=30)
+        results = await runner.run()
+
+        self.assertEqual(len(results["orders"]), 120)
+        self.assertEqual(results["end"], "2024-01-01T10:30:00+00:00")
+
+    async def test_same_seed_is_reproducible(self):
+        first = await BacktestRunner([MeanReversionStrategy("bot")], duration=120, seed=7).run()
+        second = await BacktestRunner([MeanReversionStrategy("bot")], duration=120, seed=7).run()
+
+        self.assertEqual(json.dumps(first), json.dumps(second))
+        self.assertGreater(first["strategies"]["bot"]["orders_sent"], 0)
+
+    async def test_strategy_orders_are_placed(self):
+        strategy = RecordingStrategy("student")
+        results = await BacktestRunner([strategy], duration=10, seed=1).run()
+
+        self.assertIn("candle", strategy.received)
+        self.assertIn("order_success", strategy.received)
+        self.assertEqual(results["strategies"]["student"]["orders_sent"], 10)
+        self.assertEqual(results["strategies"]["student"]["errors"], [])
+        self.assertEqual(results["strategies"]["student"]["exceptions"], [])
+
+    async def test_strategy_exceptions_are_reported(self):
+        results = await BacktestRunner([FailingStrategy("student")], duration=5, seed=1).run()
+
+        exceptions = results["strategies"]["student"]["exceptions"]
+        self.assertEqual(len(exceptions), 5)
+        self.assertEqual(exceptions[0]["exception"], "ValueError")
+        self.assertEqual(exceptions[0]["message"], "bad signal")
+        self.assertEqual(exceptions[0]["timestamp"], "2024-01-01T09:30:01+00:00")
+        self.assertEqual(results["strategies"]["student"]["orders_sent"], 0)
+
+    async def test_malformed_orders_are_reported(self):
+        results = await BacktestRunner([MalformedOrderStrategy("student")], duration=3, seed=1).run()
+
+        student = results["strategies"]["student"]
+        self.assertEqual(results["end"], "2024-01-01T09:30:03+00:00")
+        self.assertEqual(len(student["exceptions"]), 15)
+        self.assertEqual({e["exception"] for e in student["exceptions"]}, {
+                         "ValueError", "TypeError"})
+        self.assertEqual(student["orders_sent"], 3)
+        self.assertEqual(student["resting_orders"]["QNTX"], {
+                         "bid_quantity": 0, "ask_quantity": 6, "net_quantity": -6})
+
+    async def test_reacting_strategies_are_bounded(self):
+        strategies = [RecordingStrategy("a"), RecordingStrategy("b"), RecordingStrategy("c")]
+        started = time.monotonic()
+        results = await BacktestRunner(strategies, duration=20, seed=1, max_orders_per_tick=5).run()
+
+        self.assertLess(time.monotonic() - started, 10)
+        self.assertLessEqual(len(results["orders"]), 20 * (1 + 3 * 5))
+        for name in ["a", "b", "c"]:
+            self.assertLessEqual(results["strategies"][name]["orders_sent"], 20 * 5)
+            self.assertGreater(results["strategies"][name]["orders_dropped"], 0)
+
+    async def test_example_strategies_ignore_each_other(self):
+        strategies = [MeanReversionStrategy("a"), MeanReversionStrategy("b")]
+        results = await BacktestRunner(strategies, duration=120, seed=7).run()
+
+        for name in ["a", "b"]:
+            self.assertLessEqual(results["strategies"][name]["orders_sent"], 120)
+            self.assertEqual(results["strategies"][name]["orders_dropped"], 0)
@@ -0,0 +1,126 @@
+import unittest
+import json
+from src.services.market_data.candle_service import CandleSeries, TradeTape, CandleService
+from tests import test_order
+
+
+class TestCandleSeries(unittest.TestCase):
+
+    def test_prints_fold_into_bar(self):
+        series = CandleSeries(interval=60, capacity=10)
+        series.update(120, 10.0, 5)
+        series.update(130, 12.0, 1)
+        series.update(150, 9.0, 2)
+        bar = series.update(179, 11.0, 3)
+
+        self.assertEqual(bar, {"time": 120, "open": 10.0, "high": 12.0,
+                               "low": 9.0, "close": 11.0, "volume": 11.0})
+        self.assertEqual(series.count, 1)
+
+    def test_new_bar_on_interval_boundary(self):
+        series = CandleSeries(interval=60, capacity=10)
+        series.update(59, 10.0, 1)
+        series.update(60, 11.0, 1)
+
+        self.assertEqual([bar["time"] for bar in series.query()], [0, 60])
+
+    def test_stale_print_dropped(self):
+        series = CandleSeries(interval=1, capacity=10)
+        series.update(5, 10.0, 1)
+        self.assertIsNone(series.update(3, 99.0, 1))
+        self.assertEqual(series.query()[0]["high"], 10.0)
+
+    def test_ring_buffer_overwrites_oldest(self):
+        series = CandleSeries(interval=1, capacity=3)
+        for second in range(5):
+            series.update(second, 10.0 + second, 1)
+
+        self.assertEqual([bar["time"] for bar in series.query()], [2, 3, 4])
+
+    def test_range_query(self):
+        series = CandleSeries(interval=1, capacity=10)
+        for second in range(6):
+            series.update(second, 10.0, 1)
+
+        self.assertEqual([bar["time"]
+                         for bar in series.query(start=2, end=4)], [2, 3, 4])
+
+
+class TestTradeTape(unittest.TestCase):
+
+    def test_latest_is_bounded_and_ordered(self):
+        tape = TradeTape(capacity=3)
+        for i in range(5):
+            tape.append(i, 10.0 + i, 1, "Buy" if i % 2 else "Sell")
+
+        trades = tape.latest()
+        self.assertEqual([trade["price"] for trade in trades], [12.0, 13.0, 14.0])
+        self.assertEqual(trades[-1]["side"], "Sell")
+        self.assertEqual(len(tape.latest(limit=2)), 2)
+
+
+class TestCandleService(unittest.TestCase):
+
+    def test_record_updates_every_interval(self):
+        service = CandleService(["QNTX"])
+        updated = service.record("QNTX", 61, 10.0, 2, "Buy")
+
+        self.assertEqual(set(updated), {"1s", "1m", "5m"})
+        self.assertEqual(updated["1m"]["time"], 60)
+        self.assertEqual(updated["5m"]["time"], 0)
+        self.assertEqual(len(service.get_trades("QNTX")), 1)
+
+
+class TestCandleMessages(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.broadcaster = test_order.TestBroadcaster(host="localhost", port=8765, interval=30, price_lower_bound=10,
+                                                      price_upper_bound=20, ticker="QNTX", auth_service=test_order.TestAuthService(), tickers=["QNTX"])
+
+    async def test_subscriber_receives_candle_updates(self):
+        socket = test_order.TestSocket()
+        await self.broadcaster.on_message({"type": "subscribe_candles", "ticker": "QNTX", "interval": "1m"}, socket)
+
+        snapshot = json.loads(socket.get_messages()[0])
+        self.assertEqual(snapshot["type"], "candles")
+        self.assertEqual(snapshot["candles"], [])
+
+        await self.broadcaster.record_trade({"ticker": "QNTX", "price": 15.0, "quantity": 3, "type": "Buy"})
+
+        update = json.loads(socket.get_messages()[-1])
+        self.assertEqual(update["type"], "candle")
+        self.assertEqual(update["interval"], "1m")
+        self.assertEqual(update["candle"]["close"], 15.0)
+
+    async def test_trade_query(self):
+        socket = test_order.TestSocket()
+        await self.broadcaster.record_trade({"ticker": "QNTX", "price": 12.5, "quantity": 4, "type": "Sell"})
+        await self.broadcaster.on_message({"type": "trades", "ticker": "QNTX"}, socket)
+
+        response = json.loads(socket.get_messages()[0])
+        self.assertEqual(response["trades"][0]["price"], 12.5)
+        self.assertEqual(response["trades"][0]["side"], "Sell")
+
+    async def test_invalid_interval(self):
+        socket = test_order.TestSocket()
+        await self.broadcaster.on_message({"type": "candles", "ticker": "QNTX", "interval": "2h"}, socket)
+
+        response = json.loads(socket.get_messages()[0])
+        self.assertEqual(response["error_type"], "INVALID_INTERVAL")
+
+    async def test_invalid_trade_limit(self):
+        for limit in ["5", 2.5, -1, True]:
+            socket = test_order.TestSocket()
+            await self.broadcaster.on_message({"type": "trades", "ticker": "QNTX", "limit": limit}, socket)
+
+            response = json.loads(socket.get_messages()[0])
+            self.assertEqual(response["error_type"], "VALUE_ERROR")
+
+    async def test_invalid_subscription_not_added(self):
+        socket = test_order.TestSocket()
+        await self.broadcaster.on_message({"type": "subscribe_candles", "ticker": "QNTX", "interval": "1m", "start": "yesterday"}, socket)
+
+        response = json.loads(socket.get_messages()[0])
+        self.assertEqual(response["error_type"], "VALUE_ERROR")
+        self.assertNotIn(
+            socket, self.broadcaster.candle_subscriptions["QNTX"]["1m"])